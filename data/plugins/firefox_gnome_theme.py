@@ -115,6 +115,9 @@ class FirefoxGnomeTheme2Plugin(IPlugin):
         return False
 
     def apply(self, dark_theme=False):
+        # Rendered on the first profile found, then reused for the rest
+        custom_chrome = None
+
         for path in [
             "~/.mozilla/firefox",
             "~/.librewolf",
@@ -136,11 +139,14 @@ class FirefoxGnomeTheme2Plugin(IPlugin):
                 for result in results:
                     try:
                         if result.resolve().is_dir():
+                            if custom_chrome is None:
+                                custom_chrome = self.template.format_map(self.variables)
+
                             with open(
                                 f"{result}/chrome/firefox-gnome-theme/customChrome.css",
                                 "w",
                             ) as f:
-                                f.write(self.template.format(**self.variables))
+                                f.write(custom_chrome)
                     except OSError:
                         pass
             except OSError:
@@ -19,8 +19,9 @@
 import re
 
 
-# Adwaita named palette colors dict
-adw_colors = [
+# Adwaita named palette colors prefixes
+# (a tuple, so it can be passed to str.startswith as-is)
+adw_colors = (
     "blue_",
     "green_",
     "yellow_",
@@ -30,14 +31,14 @@ adw_colors = [
     "brown_",
     "light_",
     "dark_",
-]
+)
 
 # Regular expressions
 define_color = re.compile(r"(@define-color .*[^\s])")
 not_define_color = re.compile(r"(^(?:(?!@define-color).)*$)")
 
 def parse_css(path):
-    css = ""
+    css_parts = []
     variables = {}
     palette = {}
 
@@ -46,18 +47,20 @@ def parse_css(path):
 
     with open(path, "r", encoding="utf-8") as sheet:
         for line in sheet:
-            cdefine_match = re.search(define_color, line)
-            not_cdefine_match = re.search(not_define_color, line)
+            cdefine_match = define_color.search(line)
             if cdefine_match != None: # If @define-color variable declarations were found
-                palette_part = cdefine_match.__getitem__(1) # Get the second item of the re.Match object
+                palette_part = cdefine_match.group(1) # Get the first capture group of the re.Match object
                 name, color = palette_part.split(" ", 1)[1].split(" ", 1)
-                if name.startswith(tuple(adw_colors)): # Palette colors
+                if name.startswith(adw_colors): # Palette colors
                     palette[name[:-1]][name[-1:]] = color[:-1]
                 else: # Other color variables
                     variables[name] = color[:-1]
-            elif not_cdefine_match != None: # If CSS rules were found
-                css_part = not_cdefine_match.__getitem__(1)
-                css += f"{css_part}\n"
+                continue
 
-        sheet.close()
-        return variables, palette, css
+            # Only lines without a declaration need the second match
+            not_cdefine_match = not_define_color.search(line)
+            if not_cdefine_match != None: # If CSS rules were found
+                css_part = not_cdefine_match.group(1)
+                css_parts.append(f"{css_part}\n")
+
+        return variables, palette, "".join(css_parts)
@@ -161,15 +161,13 @@ def allow_file_access(directory, toast_overlay=None):
     except GLib.GError as e:
         if e.code == 4:
             logging.debug("File doesn't exist. Attempting to create one")
-            if not os.path.exists(override_dir):
-                try:
-                    dirs = Gio.File.new_for_path(override_dir)
-                    dirs.make_directory_with_parents(None)
-                except GLib.GError as e:
-                    logging.error("Unable to create directories.", exc=e)
-                    raise
-                else:
-                    logging.debug("Directories created.")
+            try:
+                os.makedirs(override_dir, exist_ok=True)
+            except OSError as e:
+                logging.error("Unable to create directories.", exc=e)
+                raise
+            else:
+                logging.debug("Directories created.")
 
             file = Gio.File.new_for_path(filename)
             file.create(Gio.FileCreateFlags.NONE, None)
@@ -275,21 +273,19 @@ def create_gtk_user_override(settings, gtk_ver, toast_overlay=None):
     except GLib.GError as e:
         if e.code == 4:
             logging.debug("File doesn't exist. Attempting to create one")
-            if not os.path.exists(override_dir):
-                try:
-                    dirs = Gio.File.new_for_path(override_dir)
-                    dirs.make_directory_with_parents(None)
-                except GLib.GError as e:
-                    logging.error("Unable to create directories.", exc=e)
-                    if is_gtk4:
-                        settings.set_boolean(
-                            "user-flatpak-theming-gtk4", False)
-                    elif is_gtk3:
-                        settings.set_boolean(
-                            "user-flatpak-theming-gtk3", False)
-                    return
-                else:
-                    logging.debug("Directories created.")
+            try:
+                os.makedirs(override_dir, exist_ok=True)
+            except OSError as e:
+                logging.error("Unable to create directories.", exc=e)
+                if is_gtk4:
+                    settings.set_boolean(
+                        "user-flatpak-theming-gtk4", False)
+                elif is_gtk3:
+                    settings.set_boolean(
+                        "user-flatpak-theming-gtk3", False)
+                return
+            else:
+                logging.debug("Directories created.")
 
             file = Gio.File.new_for_path(filename)
             file.create(Gio.FileCreateFlags.NONE, None)
@@ -417,21 +413,19 @@ def create_gtk_global_override(settings, gtk_ver, toast_overlay=None):
     except GLib.GError as e:
         if e.code == 4:
             logging.debug("File doesn't exist. Attempting to create one")
-            if not os.path.exists(override_dir):
-                try:
-                    dirs = Gio.File.new_for_path(override_dir)
-                    dirs.make_directory_with_parents(None)
-                except GLib.GError as e:
-                    logging.error("Unable to create directories.", exc=e)
-                    if is_gtk4:
-                        settings.set_boolean(
-                            "global-flatpak-theming-gtk4", False)
-                    elif is_gtk3:
-                        settings.set_boolean(
-                            "global-flatpak-theming-gtk3", False)
-                    return
-                else:
-                    logging.debug("Directories created.")
+            try:
+                os.makedirs(override_dir, exist_ok=True)
+            except OSError as e:
+                logging.error("Unable to create directories.", exc=e)
+                if is_gtk4:
+                    settings.set_boolean(
+                        "global-flatpak-theming-gtk4", False)
+                elif is_gtk3:
+                    settings.set_boolean(
+                        "global-flatpak-theming-gtk3", False)
+                return
+            else:
+                logging.debug("Directories created.")
 
             file = Gio.File.new_for_path(filename)
             file.create(Gio.FileCreateFlags.NONE, None)
@@ -102,20 +102,23 @@ custom_css_app_types = [
 
 
 class Preset:
-    variables = {}
-    palette = adw_palette
-    custom_css = {
-        "gtk4": "",
-        "gtk3": "",
-    }
-    plugins = {}
     display_name = "New Preset"
     preset_path = "new_preset"
-    plugins_list = {}
-    badges = {}
 
     def __init__(self):
-        pass
+        # Mutable defaults are per instance, so editing one preset
+        # (e.g. palette shades in the UI) doesn't leak into others
+        self.variables = {}
+        self.palette = {
+            prefix: shades.copy() for prefix, shades in adw_palette.items()
+        }
+        self.custom_css = {
+            "gtk4": "",
+            "gtk3": "",
+        }
+        self.plugins = {}
+        self.plugins_list = {}
+        self.badges = {}
 
     def new(self, variables: dict, display_name=None, palette=None, custom_css=None, badges=None):
         self.variables = variables
@@ -133,9 +136,9 @@ class Preset:
         self.preset_path = preset_path
 
         try:
-            with open(self.preset_path, "r", encoding="utf-8") as file:
+            # json.loads() decodes UTF-8 bytes itself
+            with open(self.preset_path, "rb") as file:
                 preset_text = file.read()
-                file.close()
         except OSError as e:
             logging.error(f"Failed to read contents of a preset in location: {self.preset_path}.", exc=e)
             raise
@@ -150,7 +153,7 @@ class Preset:
 
         return self
 
-    def new_from_resource(self, text: str):
+    def new_from_resource(self, text: bytes):
         preset_text = text
 
         try:
@@ -32,6 +32,10 @@ from gradience.backend.logger import Logger
 
 logging = Logger()
 
+# Preset display names keyed by file path, stored as ((mtime, size), name),
+# so that reloading the presets list doesn't re-read and re-parse unchanged files
+preset_names_cache = {}
+
 
 class PresetUtils:
     def __init__(self):
@@ -42,18 +46,18 @@ class PresetUtils:
         palette = preset.palette
         custom_css = preset.custom_css
 
-        final_css = ""
+        css_parts = []
 
         for key in variables.keys():
-            final_css += f"@define-color {key} {variables[key]};\n"
+            css_parts.append(f"@define-color {key} {variables[key]};\n")
 
         for prefix_key in palette.keys():
             for key in palette[prefix_key].keys():
-                final_css += f"@define-color {prefix_key + key} {palette[prefix_key][key]};\n"
+                css_parts.append(f"@define-color {prefix_key + key} {palette[prefix_key][key]};\n")
 
-        final_css += custom_css.get(app_type, "")
+        css_parts.append(custom_css.get(app_type, ""))
 
-        return final_css
+        return "".join(css_parts)
 
     def new_preset_from_monet(self, name=None, monet_palette=None, props=None, obj_only=False) -> Preset or None:
         if props:
@@ -170,17 +174,29 @@ class PresetUtils:
 
         def get_repo_presets(repo):
             if repo.is_dir():
+                seen_files = set()
+
                 for file_name in repo.iterdir():
                     file_name = str(file_name)
                     if file_name.endswith(".json"):
+                        preset_file = os.path.join(presets_dir, file_name)
+                        seen_files.add(preset_file)
+
                         try:
+                            stat = os.stat(preset_file)
+                            file_state = (stat.st_mtime_ns, stat.st_size)
+
+                            cached = preset_names_cache.get(preset_file)
+                            if cached and cached[0] == file_state:
+                                presets_list[file_name] = cached[1]
+                                continue
+
                             with open(
-                                os.path.join(presets_dir, file_name),
+                                preset_file,
                                 "r",
                                 encoding="utf-8",
                             ) as file:
                                 preset_text = file.read()
-                                file.close()
                         except (OSError, KeyError) as e:
                             logging.error("Failed to load preset information.", exc=e)
                             raise
@@ -193,6 +209,13 @@ class PresetUtils:
                             presets_list[file_name] = preset[
                                 "name"
                             ]
+                            preset_names_cache[preset_file] = (file_state, preset["name"])
+
+                # Forget presets that were deleted or renamed since the last pass
+                repo_dir = os.path.join(presets_dir, str(repo))
+                for cached_file in list(preset_names_cache):
+                    if os.path.dirname(cached_file) == repo_dir and cached_file not in seen_files:
+                        del preset_names_cache[cached_file]
             elif repo.is_file():
                 # this exists to keep compatibility with old presets
                 if repo.name.endswith(".json"):
@@ -211,7 +234,6 @@ class PresetUtils:
                             encoding="utf-8",
                         ) as file:
                             preset_text = file.read()
-                            file.close()
                     except (OSError, KeyError) as e:
                         logging.error("Failed to load preset information.", exc=e)
                         raise
@@ -239,86 +261,72 @@ class PresetUtils:
     def apply_preset(self, app_type: str, preset: Preset) -> None:
         if app_type == "gtk4":
             theme_dir = get_gtk_theme_dir(app_type)
+            css_path = os.path.join(theme_dir, "gtk.css")
+            backup_path = os.path.join(theme_dir, "gtk.css.bak")
 
-            if not os.path.exists(theme_dir):
-                os.makedirs(theme_dir)
+            os.makedirs(theme_dir, exist_ok=True)
 
             gtk4_css = self.generate_gtk_css("gtk4", preset)
-            contents = ""
 
             try:
-                with open(
-                    os.path.join(theme_dir, "gtk.css"), "r", encoding="utf-8"
-                ) as file:
+                with open(css_path, "r+", encoding="utf-8") as file:
                     contents = file.read()
+
+                    # Keep the previous backup if nothing would change
+                    if contents == gtk4_css:
+                        logging.debug("gtk4 preset already applied, skipping.")
+                        return
+
+                    with open(backup_path, "w", encoding="utf-8") as backup:
+                        backup.write(contents)
+
+                    file.seek(0)
+                    file.write(gtk4_css)
+                    file.truncate()
             except FileNotFoundError: # first run
-                pass
-            else:
-                with open(
-                    os.path.join(theme_dir, "gtk.css.bak"), "w", encoding="utf-8"
-                ) as file:
-                    file.write(contents)
-            finally:
-                with open(
-                    os.path.join(theme_dir, "gtk.css"), "w", encoding="utf-8"
-                ) as file:
+                with open(css_path, "w", encoding="utf-8") as file:
                     file.write(gtk4_css)
         elif app_type == "gtk3":
             theme_dir = get_gtk_theme_dir(app_type)
+            css_path = os.path.join(theme_dir, "gtk.css")
+            backup_path = os.path.join(theme_dir, "gtk.css.bak")
 
-            if not os.path.exists(theme_dir):
-                os.makedirs(theme_dir)
+            os.makedirs(theme_dir, exist_ok=True)
 
             gtk3_css = self.generate_gtk_css("gtk3", preset)
-            contents = ""
 
             try:
-                with open(
-                    os.path.join(theme_dir, "gtk.css"), "r", encoding="utf-8"
-                ) as file:
+                with open(css_path, "r+", encoding="utf-8") as file:
                     contents = file.read()
+
+                    # Keep the previous backup if nothing would change
+                    if contents == gtk3_css:
+                        logging.debug("gtk3 preset already applied, skipping.")
+                        return
+
+                    with open(backup_path, "w", encoding="utf-8") as backup:
+                        backup.write(contents)
+
+                    file.seek(0)
+                    file.write(gtk3_css)
+                    file.truncate()
             except FileNotFoundError: # first run
-                pass
-            else:
-                with open(
-                    os.path.join(theme_dir, "gtk.css.bak"), "w", encoding="utf-8"
-                ) as file:
-                    file.write(contents)
-            finally:
-                with open(
-                    os.path.join(theme_dir, "gtk.css"), "w", encoding="utf-8"
-                ) as file:
+                with open(css_path, "w", encoding="utf-8") as file:
                     file.write(gtk3_css)
 
     def restore_gtk4_preset(self) -> None:
+        theme_dir = get_gtk_theme_dir("gtk4")
+
         try:
             with open(
-                os.path.join(
-                    os.environ.get(
-                        "XDG_CONFIG_HOME", os.environ["HOME"] +
-                        "/.config"
-                    ),
-                    "gtk-4.0/gtk.css.bak",
-                ),
-                "r",
-                encoding="utf-8",
+                os.path.join(theme_dir, "gtk.css.bak"), "r", encoding="utf-8"
             ) as backup:
                 contents = backup.read()
-                backup.close()
 
             with open(
-                os.path.join(
-                    os.environ.get(
-                        "XDG_CONFIG_HOME", os.environ["HOME"] +
-                        "/.config"
-                    ),
-                    "gtk-4.0/gtk.css",
-                ),
-                "w",
-                encoding="utf-8",
+                os.path.join(theme_dir, "gtk.css"), "w", encoding="utf-8"
             ) as gtk4css:
                 gtk4css.write(contents)
-                gtk4css.close()
         except OSError as e:
             logging.error("Unable to restore Gtk4 backup.", exc=e)
             raise
@@ -326,12 +334,7 @@ class PresetUtils:
     def reset_preset(self, app_type: str) -> None:
         if app_type == "gtk4":
             file = Gio.File.new_for_path(
-                os.path.join(
-                    os.environ.get(
-                        "XDG_CONFIG_HOME", os.environ["HOME"] + "/.config"
-                    ),
-                    "gtk-4.0/gtk.css",
-                )
+                os.path.join(get_gtk_theme_dir("gtk4"), "gtk.css")
             )
 
             try:
@@ -341,12 +344,7 @@ class PresetUtils:
                 raise
         elif app_type == "gtk3":
             file = Gio.File.new_for_path(
-                os.path.join(
-                    os.environ.get(
-                        "XDG_CONFIG_HOME", os.environ["HOME"] + "/.config"
-                    ),
-                    "gtk-3.0/gtk.css",
-                )
+                os.path.join(get_gtk_theme_dir("gtk3"), "gtk.css")
             )
 
             try:
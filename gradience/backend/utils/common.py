@@ -23,8 +23,11 @@ import subprocess
 from anyascii import anyascii
 
 
+# Regular expressions
+non_slug_chars = re.compile(r"[^0-9a-z]+")
+
 def to_slug_case(non_slug) -> str:
-    return re.sub(r"[^0-9a-z]+", "-", anyascii(non_slug).lower()).strip("-")
+    return non_slug_chars.sub("-", anyascii(non_slug).lower()).strip("-")
 
 def run_command(command, *args, **kwargs):
     if isinstance(command, str): # run on the host
@@ -59,6 +59,9 @@ class GradienceApplication(Adw.Application):
     settings = Gio.Settings.new(app_id)
     portal = Xdp.Portal()
 
+    # Checked once, the GTK runtime can't change while the app is running
+    is_gtk_4_9_or_newer = (Gtk.get_major_version(), Gtk.get_minor_version()) >= (4, 9)
+
     def __init__(self):
         super().__init__(
             application_id=app_id,
@@ -301,7 +304,7 @@ class GradienceApplication(Adw.Application):
 
     def load_preset_from_resource(self, preset_path):
         preset_text = Gio.resources_lookup_data(
-            preset_path, 0).get_data().decode()
+            preset_path, 0).get_data()
 
         self.preset = Preset().new_from_resource(text=preset_text)
         self.load_preset_variables_from_preset()
@@ -443,7 +446,7 @@ class GradienceApplication(Adw.Application):
         # strings in GTK 4.8 and before.
         # https://gitlab.gnome.org/GNOME/pygobject/-/merge_requests/231
         # Credits to https://gitlab.gnome.org/amolenaar for the patch
-        if (Gtk.get_major_version(), Gtk.get_minor_version()) >= (4, 9):
+        if self.is_gtk_4_9_or_newer:
             css_provider.load_from_data(gtk_css, -1)
         else:
             css_provider.load_from_data(gtk_css.encode())
@@ -54,11 +54,11 @@ class RunAsync(threading.Thread):
         except Exception as e:
             logging.error(f"Error while running async job: {self.task_func}", exc=e)
 
-            error = exception
+            error = e
             _ex_type, _ex_value, trace = sys.exc_info()
             traceback.print_tb(trace)
             traceback_info = "\n".join(traceback.format_tb(trace))
 
-            logging.error([str(exception), traceback_info])
+            logging.error([str(e), traceback_info])
         self.source_id = GLib.idle_add(self.callback, result, error)
         return self.source_id
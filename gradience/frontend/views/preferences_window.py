@@ -49,9 +49,6 @@ class GradiencePreferencesWindow(Adw.PreferencesWindow):
 
         self.set_transient_for(self.win)
 
-        self.setup()
-
-    def setup(self):
         self.setup_flatpak_group()
 
     def setup_flatpak_group(self):
@@ -19,11 +19,11 @@
 import sys
 import time
 
-from gi.repository import Gtk, Adw, Gio
+from gi.repository import Gtk, Adw
 
 from gradience.frontend.utils.run_async import RunAsync
 from gradience.backend.flatpak_overrides import create_gtk_user_override
-from gradience.backend.constants import rootdir, app_id, rel_ver
+from gradience.backend.constants import rootdir, rel_ver
 
 from gradience.backend.logger import Logger
 
@@ -79,7 +79,8 @@ class GradienceWelcomeWindow(Adw.Window):
         # common variables and references
         self.window = window
 
-        self.gio_settings = Gio.Settings(app_id)
+        # Reuse the main window's settings object instead of opening another one
+        self.gio_settings = self.window.settings
 
         # connect signals
         self.carousel.connect("page-changed", self.page_changed)
@@ -147,9 +148,8 @@ class GradienceWelcomeWindow(Adw.Window):
             self.carousel.set_interactive(True)
 
     def agree(self, widget):
-        self.window.last_opened_version = self.window.settings.set_string(
-            "last-opened-version", rel_ver
-        )
+        if self.gio_settings.get_string("last-opened-version") != rel_ver:
+            self.gio_settings.set_string("last-opened-version", rel_ver)
 
         if self.update:
             self.btn_close.set_sensitive(True)